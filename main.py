@@ -9,6 +9,8 @@ Python Data Types Mini‑Trainer (CLI)
 - Два уровня сложности (разогрев / сложнее)
 - Мгновенная проверка, подсказки и пояснения
 - Безопасная проверка выражений через AST
+- Необязательный дисковый кэш скомпилированных ответов: включается
+  переменной окружения PY_TRAINER_CACHE_DIR=<каталог> (каталог должен быть доверенным)
 
 Советы:
 - Отвечай коротко: числом, строкой, выражением Python или вариантом ответа (A/B/C/D)
@@ -17,14 +19,16 @@ Python Data Types Mini‑Trainer (CLI)
 
 from __future__ import annotations
 import ast
-import textwrap
-import random
+import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from types import CodeType, MappingProxyType
 from typing import Callable, Any, Optional, Dict, List, Tuple
 
 # ---------------------- Безопасное вычисление выражений ----------------------
 
-ALLOWED_BUILTINS = {
+ALLOWED_BUILTINS = MappingProxyType({
     'None': None,
     'True': True,
     'False': False,
@@ -40,10 +44,14 @@ ALLOWED_BUILTINS = {
     'tuple': tuple,
     'bytes': bytes,
     'bytearray': bytearray,
-}
+})
+
+# Общий словарь глобальных имён для eval: без окружения задачи не копируется.
+# Явный пустой __builtins__ не даёт eval подставить (и записать сюда) модуль builtins.
+_BASE_GLOBALS: Dict[str, Any] = {**ALLOWED_BUILTINS, '__builtins__': {}}
 
 ALLOWED_NODES = (
-    ast.Module, ast.Expr,
+    ast.Module, ast.Expression, ast.Expr,
     ast.Load, ast.Store, ast.Del,
     ast.Name, ast.Constant,
     ast.Tuple, ast.List, ast.Set, ast.Dict,
@@ -59,29 +67,152 @@ ALLOWED_NODES = (
     ast.JoinedStr, ast.FormattedValue,
 )
 
-ALLOWED_NAMES = set(ALLOWED_BUILTINS.keys()) | {
+ALLOWED_NAMES = frozenset(ALLOWED_BUILTINS) | frozenset({
     # Переменные окружения задач подставляются динамически
     'x', 's', 'a', 'b', 't', 'd', 'nums', 's1', 's2', 'r', 'ba', 'fs'
-}
+})
 
-ALLOWED_CALLS = {
+ALLOWED_CALLS = frozenset({
     'len', 'sum', 'min', 'max', 'sorted', 'range', 'set', 'dict', 'list', 'tuple', 'bytes', 'bytearray'
-}
+})
+
+
+_ALLOWED_TYPE_SET = frozenset(ALLOWED_NODES)
 
 
 def _validate_ast(tree: ast.AST) -> None:
-    for node in ast.walk(tree):
-        if not isinstance(node, ALLOWED_NODES):
-            raise ValueError(f"Недопустимый синтаксический элемент: {type(node).__name__}")
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
+    def _walk(node: ast.AST) -> None:
+        t = type(node)
+        if t not in _ALLOWED_TYPE_SET:
+            raise ValueError(f"Недопустимый синтаксический элемент: {t.__name__}")
+        if t is ast.Call:
+            if type(node.func) is ast.Name:
                 if node.func.id not in ALLOWED_CALLS:
                     raise ValueError(f"Недопустимый вызов: {node.func.id}()")
             else:
                 raise ValueError("Разрешены только простые вызовы встроенных функций")
-        if isinstance(node, ast.Name):
+        elif t is ast.Name:
             if node.id not in ALLOWED_NAMES:
                 raise ValueError(f"Недопустимое имя: {node.id}")
+        for child in ast.iter_child_nodes(node):
+            _walk(child)
+    _walk(tree)
+
+
+# Глобальные имена для выражений, не обращающихся ни к каким именам
+_EMPTY_GLOBALS: Dict[str, Any] = {'__builtins__': {}}
+
+
+def _uses_names(tree: ast.AST) -> bool:
+    """Есть ли в дереве обращения к именам (переменным окружения или функциям)."""
+    return any(type(node) is ast.Name for node in ast.walk(tree))
+
+
+# Дисковый кэш скомпилированных выражений переживает перезапуск процесса.
+# Включается только явно: PY_TRAINER_CACHE_DIR=<каталог>. Каталог должен быть
+# доверенным — при загрузке повторяется лишь дешёвая проверка имён, полная
+# проверка AST выполнялась при записи.
+_DISK_CACHE_DIR: Optional[str] = os.environ.get('PY_TRAINER_CACHE_DIR') or None
+_DISK_CACHE_MAX_ENTRIES = 2048
+# Размер каталога проверяется при первой записи в процессе и затем раз в
+# столько записей: listdir на каждом промахе дороже самой компиляции
+_DISK_CACHE_TRIM_EVERY = 256
+_disk_cache_writes = 0
+
+
+@lru_cache(maxsize=None)
+def _policy_tag() -> str:
+    """Хэш версии байткода и правил проверки: при их изменении старые записи не подходят."""
+    import hashlib
+    import importlib.util
+    import marshal
+    policy = (
+        importlib.util.MAGIC_NUMBER,
+        tuple(sys.version_info),
+        sorted(t.__name__ for t in ALLOWED_NODES),
+        sorted(ALLOWED_NAMES),
+        sorted(ALLOWED_CALLS),
+        _validate_ast.__code__,
+        _uses_names.__code__,
+    )
+    return hashlib.blake2b(marshal.dumps(policy), digest_size=8).hexdigest()
+
+
+def _disk_cache_path(cache_dir: str, expr: str) -> str:
+    import hashlib
+    h = hashlib.blake2b(expr.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{sys.implementation.cache_tag}-{_policy_tag()}-{h}.marshal")
+
+
+def _load_cached(cache_dir: str, expr: str) -> Optional[Tuple[CodeType, bool]]:
+    import marshal
+    try:
+        with open(_disk_cache_path(cache_dir, expr), 'rb') as f:
+            code, uses_names = marshal.load(f)
+    except Exception:
+        return None
+    if not isinstance(code, CodeType) or type(uses_names) is not bool:
+        return None
+    if not set(code.co_names) <= ALLOWED_NAMES:
+        return None
+    if any(isinstance(c, CodeType) for c in code.co_consts):
+        return None
+    return code, uses_names
+
+
+def _trim_disk_cache(cache_dir: str) -> None:
+    try:
+        names = [n for n in os.listdir(cache_dir) if n.endswith('.marshal')]
+        if len(names) <= _DISK_CACHE_MAX_ENTRIES:
+            return
+        # Попадания файлы не обновляют, так что это вытеснение в порядке
+        # записи (FIFO), а не LRU. Чистим с запасом до 3/4 лимита.
+        paths = sorted((os.path.join(cache_dir, n) for n in names), key=os.path.getmtime)
+        for path in paths[:len(paths) - _DISK_CACHE_MAX_ENTRIES * 3 // 4]:
+            os.remove(path)
+    except OSError:
+        pass
+
+
+def _store_cached(cache_dir: str, expr: str, entry: Tuple[CodeType, bool]) -> None:
+    import marshal
+    global _disk_cache_writes
+    path = _disk_cache_path(cache_dir, expr)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, 'wb') as f:
+            marshal.dump(entry, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return
+    if _disk_cache_writes % _DISK_CACHE_TRIM_EVERY == 0:
+        _trim_disk_cache(cache_dir)
+    _disk_cache_writes += 1
+
+
+@lru_cache(maxsize=512)
+def _compile_expr(expr: str) -> Tuple[CodeType, bool]:
+    """Разбирает, проверяет и компилирует выражение (с кэшем по тексту).
+
+    Возвращает объект кода и признак обращения к именам. Если задан
+    PY_TRAINER_CACHE_DIR, результат также сохраняется на диск.
+    """
+    cache_dir = _DISK_CACHE_DIR
+    if cache_dir:
+        entry = _load_cached(cache_dir, expr)
+        if entry is not None:
+            return entry
+    tree = ast.parse(expr, mode='eval')
+    _validate_ast(tree)
+    entry = compile(tree, filename='<expr>', mode='eval'), _uses_names(tree)
+    if cache_dir:
+        _store_cached(cache_dir, expr, entry)
+    return entry
 
 
 def safe_eval(expr: str, env: Optional[Dict[str, Any]] = None) -> Any:
@@ -89,17 +220,19 @@ def safe_eval(expr: str, env: Optional[Dict[str, Any]] = None) -> Any:
     expr = expr.strip()
     if not expr:
         raise ValueError("Пустое выражение")
-    tree = ast.parse(expr, mode='eval')
-    _validate_ast(tree)
-    globals_env = {**ALLOWED_BUILTINS}
+    code, uses_names = _compile_expr(expr)
+    if not uses_names:
+        # Выражение без имён (числа, литералы, 'a' * 3, 1 < 2): окружение не нужно
+        return eval(code, _EMPTY_GLOBALS, {})
+    globals_env = _BASE_GLOBALS
     locals_env = {}
     if env:
         # Разрешаем переданные переменные окружения (например, x=None)
-        for k, v in env.items():
+        for k in env:
             if k not in ALLOWED_NAMES:
                 raise ValueError(f"Недопустимое имя переменной окружения: {k}")
-        globals_env.update(env)
-    return eval(compile(tree, filename='<expr>', mode='eval'), globals_env, locals_env)
+        globals_env = {**_BASE_GLOBALS, **env}
+    return eval(code, globals_env, locals_env)
 
 
 # ----------------------------- Описание задач -----------------------------
@@ -115,24 +248,30 @@ class Task:
     hint: str
     checker: Checker
 
+    def __post_init__(self) -> None:
+        # Короткие повторяющиеся строки храним в единственном экземпляре
+        self.title = sys.intern(self.title)
+        self.hint = sys.intern(self.hint)
+
 
 # Вспомогательные фабрики проверок
 
+def _exact_cmp(ans: str, *, exp: str) -> Tuple[bool, str]:
+    ok = ans.strip() == exp
+    return ok, ("Верно!" if ok else f"Ожидалось: {exp}")
+
+
 def check_exact(expected: str) -> Checker:
-    exp = expected.strip()
-    def inner(ans: str) -> Tuple[bool, str]:
-        ok = ans.strip() == exp
-        return ok, ("Верно!" if ok else f"Ожидалось: {exp}")
-    return inner
+    return partial(_exact_cmp, exp=expected.strip())
+
+
+def _mc_cmp(ans: str, *, exp: str) -> Tuple[bool, str]:
+    ok = ans.strip().upper() == exp
+    return ok, ("Верно!" if ok else f"Неверно. Правильный ответ: {exp}")
 
 
 def check_mc(correct: str) -> Checker:
-    correct = correct.strip().upper()
-    def inner(ans: str) -> Tuple[bool, str]:
-        a = ans.strip().upper()
-        ok = a == correct
-        return ok, ("Верно!" if ok else f"Неверно. Правильный ответ: {correct}")
-    return inner
+    return partial(_mc_cmp, exp=correct.strip().upper())
 
 
 def check_eval_equals(env: Dict[str, Any], expected: Any) -> Checker:
@@ -158,13 +297,41 @@ def check_eval_predicate(env: Dict[str, Any], predicate: Callable[[Any], bool],
     return inner
 
 
+def _textio_cmp(ans: str, *, exp: Tuple[str, ...]) -> Tuple[bool, str]:
+    got = tuple(p for p in (x.strip() for x in ans.split(';')) if p)
+    ok = got == exp
+    return ok, ("Верно!" if ok else f"Ожидалось: {'; '.join(exp)}")
+
+
 def check_textio(expected_lines: List[str]) -> Checker:
-    exp = [l.strip() for l in expected_lines]
-    def inner(ans: str) -> Tuple[bool, str]:
-        got = [x.strip() for x in ans.strip().split(';') if x.strip()]
-        ok = got == exp
-        return ok, ("Верно!" if ok else f"Ожидалось: {'; '.join(exp)}")
-    return inner
+    return partial(_textio_cmp, exp=tuple(l.strip() for l in expected_lines))
+
+
+@lru_cache(maxsize=512)
+def _compile_stmt(src: str) -> CodeType:
+    return compile(src, filename='<ans>', mode='exec')
+
+
+def _check_exec_env(initial_factory: Callable[[], Any], expected: Any, var_name: str, ans: str) -> Tuple[bool, str]:
+    """Выполняет код ответа один раз и проверяет, как изменился исходный объект."""
+    got = initial_factory()
+    env = {var_name: got}
+    try:
+        exec(_compile_stmt(ans.strip()), {}, env)
+    except Exception as e:
+        return False, f"Ошибка: {e}"
+    ok = got == expected
+    return ok, ("Верно!" if ok else f"Неверно. Ожидалось, что {var_name} станет {expected!r}, получилось {got!r}")
+
+
+_VOWELS = 'аеёиоуыэюяaeiouy'
+# Таблица для str.translate, удаляющая гласные в любом регистре
+_VOWEL_DELETE_TABLE = dict.fromkeys(map(ord, _VOWELS + _VOWELS.upper()))
+
+
+def _count_vowels(s: str) -> int:
+    """Считает гласные за один проход str.translate на уровне C."""
+    return len(s) - len(s.translate(_VOWEL_DELETE_TABLE))
 
 
 # Сборка задач
@@ -175,13 +342,11 @@ tasks: List[Task] = [
         id="none_is",
         title="Проверка на None",
         level="easy",
-        prompt=textwrap.dedent(
-            """
-            Дано: x = None
-            Напиши выражение, которое True, только если x действительно None.
-            (Пиши ТОЛЬКО выражение.)
-            """
-        ).strip(),
+        prompt=(
+            "Дано: x = None\n"
+            "Напиши выражение, которое True, только если x действительно None.\n"
+            "(Пиши ТОЛЬКО выражение.)"
+        ),
         hint="Используй оператор идентичности, не сравнение.",
         checker=check_eval_equals({'x': None}, True),
     ),
@@ -189,21 +354,19 @@ tasks: List[Task] = [
         id="none_default",
         title="Функция с безопасным значением по умолчанию",
         level="hard",
-        prompt=textwrap.dedent(
-            """
-            Что выведет программа? Ответ запиши как два вывода через ';'
-            (пример: [1]; [1])
-
-            def f(a=None):
-                if a is None:
-                    a = []
-                a.append(1)
-                return a
-
-            print(f())
-            print(f())
-            """
-        ).strip(),
+        prompt=(
+            "Что выведет программа? Ответ запиши как два вывода через ';'\n"
+            "(пример: [1]; [1])\n"
+            "\n"
+            "def f(a=None):\n"
+            "    if a is None:\n"
+            "        a = []\n"
+            "    a.append(1)\n"
+            "    return a\n"
+            "\n"
+            "print(f())\n"
+            "print(f())"
+        ),
         hint="При a=None новая пустая list создаётся на каждом вызове.",
         checker=check_textio(["[1]", "[1]"]),
     ),
@@ -259,7 +422,7 @@ tasks: List[Task] = [
         level="hard",
         prompt="Дано: s='Привет, Python!'. Напиши выражение, которое возвращает количество гласных (русские и английские).",
         hint="Используй set гласных и sum(ch in vowels for ch in s.lower()).",
-        checker=check_eval_equals({'s': 'Привет, Python!'}, 4),
+        checker=check_eval_equals({'s': 'Привет, Python!'}, _count_vowels('Привет, Python!')),
     ),
 
     # tuple
@@ -275,14 +438,12 @@ tasks: List[Task] = [
         id="tuple_mutable_inside",
         title="Неизменяемость контейнера и изменяемость элемента",
         level="hard",
-        prompt=textwrap.dedent(
-            """
-            Что напечатает код? Ответ как кортеж.
-            t = (1, 2, [3, 4])
-            t[2].append(5)
-            print(t)
-            """
-        ).strip(),
+        prompt=(
+            "Что напечатает код? Ответ как кортеж.\n"
+            "t = (1, 2, [3, 4])\n"
+            "t[2].append(5)\n"
+            "print(t)"
+        ),
         hint="Кортеж неизменяем, но список внутри — изменяем.",
         checker=check_exact("(1, 2, [3, 4, 5])"),
     ),
@@ -300,38 +461,13 @@ tasks: List[Task] = [
         id="list_remove_evens",
         title="Удаление чётных на месте",
         level="hard",
-        prompt=textwrap.dedent(
-            """
-            Дано: nums = [1,2,3,4,5,6]
-            Напиши выражение/код ОДНОЙ СТРОКОЙ, которое удалит все чётные числа ИЗ nums на месте (in-place).
-            Подсказка: срезовая запись.
-            """
-        ).strip(),
-        hint="nums[:] = [x for x in nums if x % 2]",
-        checker=lambda ans: (
-            (lambda: (
-                (lambda res: (
-                    isinstance(res, list) and res == [1,3,5]
-                ))(
-                    (lambda: (
-                        (lambda _nums: (
-                            exec(ans, {}, {'nums': _nums}) or _nums
-                        ))([1,2,3,4,5,6])
-                    ))()
-                )
-            ))(),
-            "Верно!" if (lambda: (
-                (lambda res: (
-                    isinstance(res, list) and res == [1,3,5]
-                ))(
-                    (lambda: (
-                        (lambda _nums: (
-                            exec(ans, {}, {'nums': _nums}) or _nums
-                        ))([1,2,3,4,5,6])
-                    ))()
-                )
-            ))() else "Неверно. Ожидалось, что nums станет [1,3,5]"
+        prompt=(
+            "Дано: nums = [1,2,3,4,5,6]\n"
+            "Напиши выражение/код ОДНОЙ СТРОКОЙ, которое удалит все чётные числа ИЗ nums на месте (in-place).\n"
+            "Подсказка: срезовая запись."
         ),
+        hint="nums[:] = [x for x in nums if x % 2]",
+        checker=partial(_check_exec_env, lambda: [1,2,3,4,5,6], [1,3,5], 'nums'),
     ),
 
     # dict
@@ -383,34 +519,13 @@ tasks: List[Task] = [
         id="bytearray_modify",
         title="Правка первого байта",
         level="hard",
-        prompt=textwrap.dedent(
-            """
-            Дано: ba = bytearray(b'abc')
-            Напиши выражение одной строкой, которое заменит первый байт на код 'A'.
-            После выполнения ba должно стать bytearray(b'Abc').
-            """
-        ).strip(),
-        hint="ba[0] = ord('A')",
-        checker=lambda ans: (
-            (lambda: (
-                (lambda res: res == bytearray(b'Abc'))(
-                    (lambda: (
-                        (lambda _ba: (
-                            exec(ans, {}, {'ba': _ba}) or _ba
-                        ))(bytearray(b'abc'))
-                    ))()
-                )
-            ))(),
-            "Верно!" if (lambda: (
-                (lambda res: res == bytearray(b'Abc'))(
-                    (lambda: (
-                        (lambda _ba: (
-                            exec(ans, {}, {'ba': _ba}) or _ba
-                        ))(bytearray(b'abc'))
-                    ))()
-                )
-            ))() else "Неверно. Ожидалось bytearray(b'Abc')"
+        prompt=(
+            "Дано: ba = bytearray(b'abc')\n"
+            "Напиши выражение одной строкой, которое заменит первый байт на код 'A'.\n"
+            "После выполнения ba должно стать bytearray(b'Abc')."
         ),
+        hint="ba[0] = ord('A')",
+        checker=partial(_check_exec_env, lambda: bytearray(b'abc'), bytearray(b'Abc'), 'ba'),
     ),
 
     # range
@@ -432,6 +547,52 @@ tasks: List[Task] = [
     ),
 ]
 
+# Неизменяемые наборы задач по режимам: собираются один раз при импорте
+_POOLS: Dict[str, Tuple[Task, ...]] = {
+    'easy': tuple(t for t in tasks if t.level == 'easy'),
+    'hard': tuple(t for t in tasks if t.level == 'hard'),
+    'mixed': tuple(tasks),
+}
+
+TASK_BY_ID: Dict[str, Task] = {t.id: t for t in tasks}
+
+
+def grade(task_id: str, answer: str) -> Tuple[bool, str]:
+    """Проверяет ответ на задачу по её id (для автопроверки без CLI)."""
+    return TASK_BY_ID[task_id].checker(answer)
+
+
+# Запуск пула процессов стоит десятки миллисекунд — столько же, сколько
+# последовательная проверка примерно тысячи ответов
+_PARALLEL_MIN_BATCH = 1024
+
+
+def _grade_safe(sub: Tuple[str, str]) -> Tuple[bool, str]:
+    try:
+        return grade(*sub)
+    except Exception as e:
+        return False, f"Ошибка проверки: {e}"
+
+
+def grade_batch(subs: List[Tuple[str, str]], workers: Optional[int] = None) -> List[Tuple[bool, str]]:
+    """Проверяет пачку пар (task_id, ответ) в пуле процессов.
+
+    Каждый процесс получает ответы порциями, так что кэши компиляции
+    выражений переиспользуются внутри процесса. При одном процессе или
+    пачке меньше max(4 * процессов, _PARALLEL_MIN_BATCH) проверка идёт
+    последовательно: запуск пула дороже, чем проверка такой пачки.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers должно быть не меньше 1")
+    n = workers or os.cpu_count() or 1
+    if n == 1 or len(subs) < max(n * 4, _PARALLEL_MIN_BATCH):
+        return [_grade_safe(sub) for sub in subs]
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(subs) // (n * 4))
+    with ProcessPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(_grade_safe, subs, chunksize=chunksize))
+
+
 # ----------------------------- Движок тренажёра -----------------------------
 
 WELCOME = """
@@ -447,37 +608,47 @@ WELCOME = """
 def select_mode() -> str:
     print(WELCOME)
     while True:
-        choice = input("> ").strip()
+        try:
+            choice = input("> ").strip()
+        except EOFError:
+            print()
+            raise SystemExit(0)
         if choice in {"1", "2", "3"}:
             return {"1": "easy", "2": "hard", "3": "mixed"}[choice]
         print("Введите 1, 2 или 3.")
 
 
 def run_tasks(mode: str) -> None:
-    if mode == "mixed":
-        pool = tasks[:]
-    else:
-        pool = [t for t in tasks if t.level == mode]
+    # Нужны только интерактивному режиму: не замедляем импорт для grade()
+    import random
+    import textwrap
 
-    random.shuffle(pool)
+    base = _POOLS[mode]
+    pool = random.sample(base, len(base))
     score = 0
     total = len(pool)
 
     print(f"\nСтартуем! Всего задач: {total}. Для подсказки введи: ?  Для выхода: q\n")
 
     for i, task in enumerate(pool, 1):
-        print(f"[{i}/{total}] {task.title}")
-        print(textwrap.indent(task.prompt, prefix="  "))
+        # Заголовок и условие задачи выводим одной записью
+        sys.stdout.write(f"[{i}/{total}] {task.title}\n" + textwrap.indent(task.prompt, prefix="  ") + "\n")
+        sys.stdout.flush()
 
         while True:
-            ans = input("Ваш ответ: ").rstrip("\n")
-            if ans.strip().lower() == 'q':
-                print("Выход из тренажёра. Спасибо за игру!")
-                print(f"Результат: {score}/{i-1}")
-                return
-            if ans.strip() == '?':
+            try:
+                ans = input("Ваш ответ: ").rstrip("\n")
+            except EOFError:
+                # Переводим строку, чтобы сообщение не слиплось с приглашением
+                print()
+                ans = 'q'
+            stripped = ans.strip()
+            if stripped == '?':
                 print(f"Подсказка: {task.hint}")
                 continue
+            if len(stripped) == 1 and stripped in 'qQ':
+                print(f"Выход из тренажёра. Спасибо за игру!\nРезультат: {score}/{i-1}", flush=True)
+                return
             try:
                 ok, msg = task.checker(ans)
             except Exception as e:
@@ -488,21 +659,26 @@ def run_tasks(mode: str) -> None:
                 break
             else:
                 # Даем возможность ещё раз попробовать
-                retry = input("Попробовать ещё раз? (y/n): ").strip().lower()
-                if retry != 'y':
+                try:
+                    retry = input("Попробовать ещё раз? (y/n): ").strip()
+                except EOFError:
+                    print()
+                    retry = 'n'
+                if retry not in ('y', 'Y'):
                     break
         print("-" * 60)
 
-    print(f"Готово! Ваш счёт: {score}/{total}")
     if score == total:
-        print("Идеально! 🔥")
+        verdict = "Идеально! 🔥"
     elif score / total >= 0.7:
-        print("Отличный результат! 💪")
+        verdict = "Отличный результат! 💪"
     else:
-        print("Хорошее начало — можно ещё потренироваться. 🙂")
+        verdict = "Хорошее начало — можно ещё потренироваться. 🙂"
+    print(f"Готово! Ваш счёт: {score}/{total}\n{verdict}", flush=True)
 
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=True)
     mode = select_mode()
     run_tasks(mode)
 